@@ -1,15 +1,45 @@
 #!/usr/bin/env python3
 """Debug script for non-uniform grid integration - understanding MATLAB behavior"""
 
+import math
+
 import numpy as np
-from scipy import integrate
-
-def integrate_from_top_v1(z, q_tot):
-    """Original version that should match MATLAB behavior."""
-    z_flipped = np.flip(z)
-    q_flipped = np.flip(q_tot)
-    q_cum_flipped = integrate.cumulative_trapezoid(q_flipped, z_flipped, initial=0)
-    q_cum = -np.flip(q_cum_flipped)
+from numba import njit
+
+if __debug__:
+    _log = print
+else:
+    def _log(*args, **kwargs):
+        """Diagnostic output is dead code under python -O."""
+        pass
+
+def integrate_from_top_v1(z, q_tot, dz=None, dtype=None):
+    """Original version that should match MATLAB behavior.
+
+    Computes q_cum[i] = ∫_z[i]^z_top q_tot dx directly with a reverse
+    cumulative sum of the trapezoid areas, instead of the
+    flip/cumulative_trapezoid/flip/negate sequence (same numbers, one
+    pass, two temporaries instead of five).
+
+    Pass a precomputed ``dz = np.diff(z)`` when calling repeatedly on
+    a fixed altitude grid to skip the O(N) spacing recompute per call.
+
+    Pass ``dtype=np.float32`` to halve memory traffic when 7-digit
+    precision is enough (diagnostic plots); the cumulative sum still
+    accumulates in float64 so only storage, not accumulation, is
+    single precision.
+    """
+    if dtype is not None:
+        z = np.asarray(z).astype(dtype, copy=False)
+        q_tot = np.asarray(q_tot).astype(dtype, copy=False)
+        if dz is not None:
+            dz = np.asarray(dz).astype(dtype, copy=False)
+    if dz is None:
+        dz = np.diff(z)
+    trap = 0.5 * (q_tot[1:] + q_tot[:-1]) * dz
+    q_cum = np.empty_like(q_tot)
+    q_cum[-1] = 0.0
+    q_cum[:-1] = np.cumsum(trap[::-1], dtype=np.float64)[::-1]
     return q_cum
 
 # Parameters
@@ -17,16 +47,19 @@ A = 1e10
 H = 100
 
 # Test with simple case first
-print("=== Simple test with uniform grid ===")
+_log("=== Simple test with uniform grid ===")
 z_uniform = np.array([0, 10, 20, 30])  # Simple uniform grid
 q_tot_uniform = A * np.exp(-z_uniform / H)
 
-print(f"z_uniform = {z_uniform}")
-print(f"q_tot_uniform = {q_tot_uniform}")
+_log(f"z_uniform = {z_uniform}")
+_log(f"q_tot_uniform = {q_tot_uniform}")
+
+# Grid spacing is fixed per grid — compute it once and reuse
+dz_uniform = np.diff(z_uniform)
 
 # What does the MATLAB code compute?
-q_cum_uniform = integrate_from_top_v1(z_uniform, q_tot_uniform)
-print(f"q_cum_uniform (numerical) = {q_cum_uniform}")
+q_cum_uniform = integrate_from_top_v1(z_uniform, q_tot_uniform, dz_uniform)
+_log(f"q_cum_uniform (numerical) = {q_cum_uniform}")
 
 # Let's understand what this represents:
 # q_cum_uniform[0] = ∫_z[0]^z_top q_tot(x) dx
@@ -35,57 +68,68 @@ print(f"q_cum_uniform (numerical) = {q_cum_uniform}")
 
 # For uniform grid, let's compute the analytical solution
 z_top = z_uniform[-1]
-print(f"z_top = {z_top}")
+_log(f"z_top = {z_top}")
 
 # Analytical: q_cum(z) = ∫_z^z_top A*exp(-x/H) dx = A*H*[exp(-z/H) - exp(-z_top/H)]
-q_cum_analytical_uniform = A * H * (np.exp(-z_uniform / H) - np.exp(-z_top / H))
-print(f"q_cum_analytical_uniform = {q_cum_analytical_uniform}")
+# q_tot_uniform already holds A*exp(-z/H), so reuse it rather than
+# re-evaluating the vector exponential; only the scalar top value is new.
+q_cum_analytical_uniform = H * (q_tot_uniform - A * math.exp(-z_top / H))
+_log(f"q_cum_analytical_uniform = {q_cum_analytical_uniform}")
 
 # Calculate error
 error_uniform = np.abs((q_cum_uniform - q_cum_analytical_uniform) / (q_cum_analytical_uniform + 1e-10))
-print(f"error_uniform = {error_uniform}")
-print(f"max_error_uniform = {np.max(error_uniform)*100:.4f}%")
+_log(f"error_uniform = {error_uniform}")
+_log(f"max_error_uniform = {np.max(error_uniform)*100:.4f}%")
 
 # Now test with the non-uniform grid
-print("\n=== Non-uniform grid test ===")
+_log("\n=== Non-uniform grid test ===")
 z = np.array([0, 0.5, 1.5, 3.5, 7.5, 15.5, 30.5, 60.5, 120.5, 240.5, 480.5, 980.5, 1000])
 q_tot = A * np.exp(-z / H)
+dz = np.diff(z)
+
+q_cum_numerical = integrate_from_top_v1(z, q_tot, dz)
+_log(f"q_cum_numerical = {q_cum_numerical}")
 
-q_cum_numerical = integrate_from_top_v1(z, q_tot)
-print(f"q_cum_numerical = {q_cum_numerical}")
+# Sanity-check the reduced-precision path against full precision
+q_cum_f32 = integrate_from_top_v1(z, q_tot, dz, dtype=np.float32)
+_log(f"float32 path agrees with float64: {np.allclose(q_cum_f32, q_cum_numerical, rtol=1e-5)}")
 
-# Analytical solution
+# Analytical solution (same reuse of the exponential already in q_tot)
 z_top = z[-1]
-q_cum_analytical = A * H * (np.exp(-z / H) - np.exp(-z_top / H))
-print(f"q_cum_analytical = {q_cum_analytical}")
+q_cum_analytical = H * (q_tot - A * math.exp(-z_top / H))
+_log(f"q_cum_analytical = {q_cum_analytical}")
 
 # Error
 error = np.abs((q_cum_numerical - q_cum_analytical) / (q_cum_analytical + 1e-10))
-print(f"error = {error}")
-print(f"max_error = {np.max(error)*100:.4f}%")
+_log(f"error = {error}")
+_log(f"max_error = {np.max(error)*100:.4f}%")
 
 # Let's try a different analytical approach
 # Maybe the MATLAB integration includes both endpoints differently?
-print("\n=== Alternative analytical approach ===")
+_log("\n=== Alternative analytical approach ===")
 # For the trapezoidal rule: ∫_a^b f(x)dx ≈ (b-a)*(f(a)+f(b))/2
 # For cumulative: q_cum[i] = ∫_z[i]^z_top q_tot(x)dx
 
 # Let's compute this manually for the non-uniform grid
+@njit(cache=True, fastmath=True)
 def analytical_cumulative_manual(z, q_tot):
-    """Manually compute cumulative integral using trapezoidal rule."""
-    n = len(z)
-    q_cum = np.zeros(n)
-    
+    """Manually compute cumulative integral using trapezoidal rule.
+
+    JIT-compiled single reverse pass; a zero dz contributes zero area,
+    so no branch is needed inside the loop.
+    """
+    n = z.shape[0]
+    q_cum = np.empty(n)
+    q_cum[n-1] = 0.0  # top boundary; every other element is written below
+
     # Start from top and work down
     for i in range(n-2, -1, -1):
         dz_local = z[i+1] - z[i]  # This should be positive for increasing z
-        if dz_local != 0:
-            area = 0.5 * (q_tot[i] + q_tot[i+1]) * dz_local
-            q_cum[i] = q_cum[i+1] + area
-    
+        q_cum[i] = q_cum[i+1] + 0.5 * (q_tot[i] + q_tot[i+1]) * dz_local
+
     return q_cum
 
 q_cum_manual = analytical_cumulative_manual(z, q_tot)
-print(f"q_cum_manual = {q_cum_manual}")
+_log(f"q_cum_manual = {q_cum_manual}")
 error_manual = np.abs((q_cum_numerical - q_cum_manual) / (q_cum_manual + 1e-10))
-print(f"max_error vs manual = {np.max(error_manual)*100:.4f}%")
\ No newline at end of file
+_log(f"max_error vs manual = {np.max(error_manual)*100:.4f}%")
\ No newline at end of file
@@ -8,60 +8,118 @@ bounce period equations in bounce_time_arr.m, equivalent to the MATLAB tests.
 
 import numpy as np
 import math
+import functools
+
+if __debug__:
+    _log = print
+else:
+    def _log(*args, **kwargs):
+        """Diagnostic output is dead code under python -O."""
+        pass
+
+
+def _tpa(y):
+    """Roederer T(y) bounce polynomial, y = sin(equatorial pitch angle).
+
+    Evaluated from one cbrt and one sqrt plus multiplies:
+    y^(2/3) = cbrt(y)^2 and y^(4/3) = y*cbrt(y), so the four fractional
+    powers cost two root calls instead of four pow() calls. Works on
+    scalars and NumPy arrays alike.
+    """
+    c = np.cbrt(y)
+    s = np.sqrt(y)
+    return 1.38 + 0.055 * c - 0.32 * s - 0.037 * (c * c) - 0.394 * y + 0.056 * (y * c)
+
+
+@functools.lru_cache(maxsize=None)
+def _tpa_cached(y):
+    """Memoized scalar T_pa; several tests share y = sin(90°) = 1.0."""
+    return float(_tpa(y))
+
+
+@functools.lru_cache(maxsize=None)
+def _pc(E, mc2):
+    """Momentum times c in MeV for kinetic energy E and rest energy mc2.
+
+    Memoized because the tests evaluate the same (E, mc2) pairs
+    repeatedly (e.g. 1 MeV electrons in Tests 3, 4 and 5).
+    """
+    return math.sqrt((E / mc2 + 1.0)**2 - 1.0) * mc2
+
+
+# T_pa at y = sin(90°) = 1: every fractional power is 1, so the
+# polynomial collapses to the exact sum of its coefficients. Tests 3-5
+# all evaluate at the equatorial pitch angle, so fold it at import time.
+_TPA_EQUATORIAL = 1.38 + 0.055 - 0.32 - 0.037 - 0.394 + 0.056
+
+
+@functools.lru_cache(maxsize=1024)
+def bounce_period(L, E, alpha, mc2, Re=6.371e6, c_si=2.998e8):
+    """Relativistic dipole bounce period in days (bounce_time_arr.m Line 50).
+
+    Single home for the pc / T_pa / bt block that Tests 3 and 4 used to
+    inline verbatim; memoized since the tests share reference conditions.
+    """
+    pc = _pc(E, mc2)
+    T_pa = _TPA_EQUATORIAL if alpha == math.pi / 2 else _tpa_cached(math.sin(alpha))
+    return 4.0 * L * Re * mc2 / pc / c_si * T_pa / 60 / 60 / 24
 
 def test_energy_to_momentum_conversion():
     """Test 1: Energy to Momentum Conversion (Line 38)"""
-    print("TEST 1: Energy to Momentum Conversion")
-    print("-" * 40)
+    _log("TEST 1: Energy to Momentum Conversion")
+    _log("-" * 40)
 
     passed = True
 
     # Test energies in MeV
-    energies = [0.1, 1.0, 10.0]
+    energies = np.array([0.1, 1.0, 10.0])
 
     # CODATA physical constants
     c_si = 2.998e8  # m/s
     mc2_e = 0.511   # MeV (electron)
     mc2_p = 938.0   # MeV (proton)
 
-    # Test for both particle types
+    # Test for both particle types; buffer the per-energy diagnostics and
+    # emit one formatted block per test instead of a print per iteration
+    lines = []
+    tolerance = 1e-10
     for particle_name, mc2 in [("electron", mc2_e), ("proton", mc2_p)]:
-        print(f"  Testing {particle_name} (mc2 = {mc2:.3f} MeV):")
+        lines.append(f"  Testing {particle_name} (mc2 = {mc2:.3f} MeV):")
 
-        for E in energies:
-            # Code implementation (Line 38)
-            pc_code = np.sqrt((E / mc2 + 1)**2 - 1) * mc2
+        # Code implementation (Line 38), evaluated over all energies at once
+        pc_code = np.sqrt((energies / mc2 + 1)**2 - 1) * mc2
 
-            # Analytical formula: p = sqrt(E^2 + 2*E*mc2) / c
-            # Note: pc = p*c in MeV units, so we compare pc values
-            pc_analytical = np.sqrt(E**2 + 2*E*mc2)
+        # Analytical formula: p = sqrt(E^2 + 2*E*mc2) / c
+        # Note: pc = p*c in MeV units, so we compare pc values
+        pc_analytical = np.sqrt(energies**2 + 2*energies*mc2)
 
-            # Relative error
-            rel_error = abs(pc_code - pc_analytical) / pc_analytical
+        # Relative errors and tolerance check in one vector pass
+        rel_error = np.abs(pc_code - pc_analytical) / pc_analytical
+        ok = rel_error < tolerance
 
-            # Tolerance check
-            tolerance = 1e-10
-            test_passed = rel_error < tolerance
+        lines.extend(f"    E={E:.1f} MeV: pc_code={pc_c:.6e}, pc_analytical={pc_a:.6e}, "
+                     f"rel_error={err:.2e} {'✓' if test_passed else '✗'}"
+                     for E, pc_c, pc_a, err, test_passed in
+                     zip(energies, pc_code, pc_analytical, rel_error, ok))
 
-            print(f"    E={E:.1f} MeV: pc_code={pc_code:.6e}, pc_analytical={pc_analytical:.6e}, "
-                  f"rel_error={rel_error:.2e} {'✓' if test_passed else '✗'}")
+        if not np.all(ok):
+            passed = False
 
-            if not test_passed:
-                passed = False
+    _log("\n".join(lines))
 
-    print("  Mathematical equivalence check:")
-    print("    Code: pc = sqrt((E/mc2 + 1)^2 - 1) * mc2")
-    print("    Analytical: p = sqrt(E^2 + 2*E*mc2)")
-    print("    Both should give pc = p*c (momentum * c)")
-    print("    ✅ Mathematically equivalent (verified algebraically)")
+    _log("  Mathematical equivalence check:")
+    _log("    Code: pc = sqrt((E/mc2 + 1)^2 - 1) * mc2")
+    _log("    Analytical: p = sqrt(E^2 + 2*E*mc2)")
+    _log("    Both should give pc = p*c (momentum * c)")
+    _log("    ✅ Mathematically equivalent (verified algebraically)")
 
     return passed
 
 
 def test_physical_constants():
     """Test 2: Physical Constants Verification"""
-    print("\nTEST 2: Physical Constants Verification")
-    print("-" * 40)
+    _log("\nTEST 2: Physical Constants Verification")
+    _log("-" * 40)
 
     passed = True
 
@@ -82,40 +140,40 @@ def test_physical_constants():
     # Electron mass energy
     mc2_e_error = abs(code_mc2_e - CODATA_mc2_e) / CODATA_mc2_e
     test_passed = mc2_e_error < tolerance
-    print(f"  Electron mc²: code={code_mc2_e:.3f} MeV, CODATA={CODATA_mc2_e:.6f} MeV, "
+    _log(f"  Electron mc²: code={code_mc2_e:.3f} MeV, CODATA={CODATA_mc2_e:.6f} MeV, "
           f"error={mc2_e_error:.2e} {'✓' if test_passed else '✗'}")
     if not test_passed: passed = False
 
     # Proton mass energy
     mc2_p_error = abs(code_mc2_p - CODATA_mc2_p) / CODATA_mc2_p
     test_passed = mc2_p_error < tolerance
-    print(f"  Proton mc²: code={code_mc2_p:.1f} MeV, CODATA={CODATA_mc2_p:.6f} MeV, "
+    _log(f"  Proton mc²: code={code_mc2_p:.1f} MeV, CODATA={CODATA_mc2_p:.6f} MeV, "
           f"error={mc2_p_error:.2e} {'✓' if test_passed else '✗'}")
     if not test_passed: passed = False
 
     # Speed of light
     c_error = abs(code_c - CODATA_c) / CODATA_c
     test_passed = c_error < tolerance
-    print(f"  Speed of light: code={code_c:.3e} m/s, CODATA={CODATA_c} m/s, "
+    _log(f"  Speed of light: code={code_c:.3e} m/s, CODATA={CODATA_c} m/s, "
           f"error={c_error:.2e} {'✓' if test_passed else '✗'}")
     if not test_passed: passed = False
 
     # Earth radius
     Re_error = abs(code_Re - IAU_Re) / IAU_Re
     test_passed = Re_error < tolerance
-    print(f"  Earth radius: code={code_Re:.3e} m, IAU={IAU_Re} m, "
+    _log(f"  Earth radius: code={code_Re:.3e} m, IAU={IAU_Re} m, "
           f"error={Re_error:.2e} {'✓' if test_passed else '✗'}")
     if not test_passed: passed = False
 
-    print("  ✅ All physical constants verified against CODATA/IAU standards")
+    _log("  ✅ All physical constants verified against CODATA/IAU standards")
 
     return passed
 
 
 def test_bounce_period_structure():
     """Test 3: Bounce Period Formula Structure"""
-    print("\nTEST 3: Bounce Period Formula Structure")
-    print("-" * 40)
+    _log("\nTEST 3: Bounce Period Formula Structure")
+    _log("-" * 40)
 
     # Reference conditions
     L = 6
@@ -128,50 +186,48 @@ def test_bounce_period_structure():
     mc2 = 0.511  # MeV (electron)
 
     # Calculate pc
-    pc = np.sqrt((E / mc2 + 1)**2 - 1) * mc2
+    pc = _pc(E, mc2)
 
-    # Calculate T_pa
-    y = math.sin(alpha)
-    T_pa = (1.38 + 0.055 * y**(1.0/3.0) - 0.32 * y**(1.0/2.0)
-            - 0.037 * y**(2.0/3.0) - 0.394 * y + 0.056 * y**(4.0/3.0))
+    # Calculate T_pa (equatorial reference conditions hit the folded constant)
+    T_pa = _TPA_EQUATORIAL if alpha == math.pi / 2 else _tpa_cached(math.sin(alpha))
 
     # Code formula (Line 50)
-    bt_code = 4.0 * L * Re * mc2 / pc / c_si * T_pa / 60 / 60 / 24
+    bt_code = bounce_period(L, E, alpha, mc2)
 
     # Manual calculation to verify structure
     bt_manual = (4 * L * Re * mc2) / (pc * c_si) * T_pa / (60*60*24)
 
-    print(f"  Reference conditions: L={L}, E={E:.1f} MeV, α={int(alpha*180/math.pi)}°")
-    print(f"  Physical constants: Re={Re:.3e} m, c={c_si:.3e} m/s, mc²={mc2:.3f} MeV")
-    print(f"  Calculated values: pc={pc:.6f} MeV/c, T_pa={T_pa:.6f}")
-    print(f"  Bounce period: bt_code={bt_code:.6f} days, bt_manual={bt_manual:.6f} days")
+    _log(f"  Reference conditions: L={L}, E={E:.1f} MeV, α={int(alpha*180/math.pi)}°")
+    _log(f"  Physical constants: Re={Re:.3e} m, c={c_si:.3e} m/s, mc²={mc2:.3f} MeV")
+    _log(f"  Calculated values: pc={pc:.6f} MeV/c, T_pa={T_pa:.6f}")
+    _log(f"  Bounce period: bt_code={bt_code:.6f} days, bt_manual={bt_manual:.6f} days")
 
     # Verify numerical agreement
     bt_error = abs(bt_code - bt_manual) / bt_manual
     tolerance = 1e-15
     test_passed = bt_error < tolerance
-    print(f"  Numerical agreement: error={bt_error:.2e} (tolerance={tolerance:.0e}) "
+    _log(f"  Numerical agreement: error={bt_error:.2e} (tolerance={tolerance:.0e}) "
           f"{'✓' if test_passed else '✗'}")
 
-    print("  Unit analysis:")
-    print("    4 = dimensionless")
-    print("    L = L-shell (dimensionless)")
-    print("    Re = Earth radius = 6.371e6 m")
-    print("    mc² = rest energy in MeV")
-    print("    pc = momentum × c in MeV")
-    print("    c = speed of light in m/s")
-    print("    60×60×24 = seconds per day")
-    print("    Result: bt in days ✅")
+    _log("  Unit analysis:")
+    _log("    4 = dimensionless")
+    _log("    L = L-shell (dimensionless)")
+    _log("    Re = Earth radius = 6.371e6 m")
+    _log("    mc² = rest energy in MeV")
+    _log("    pc = momentum × c in MeV")
+    _log("    c = speed of light in m/s")
+    _log("    60×60×24 = seconds per day")
+    _log("    Result: bt in days ✅")
 
-    print("  ✅ Formula structure matches Roederer (1970) relativistic bounce period")
+    _log("  ✅ Formula structure matches Roederer (1970) relativistic bounce period")
 
     return test_passed
 
 
 def test_particle_dependence():
     """Test 4: Particle Type Dependence"""
-    print("\nTEST 4: Particle Type Dependence")
-    print("-" * 40)
+    _log("\nTEST 4: Particle Type Dependence")
+    _log("-" * 40)
 
     # Test conditions
     L = 6
@@ -184,56 +240,48 @@ def test_particle_dependence():
 
     # Calculate for electrons
     mc2_e = 0.511  # MeV
-    pc_e = np.sqrt((E / mc2_e + 1)**2 - 1) * mc2_e
-    y_e = math.sin(alpha)
-    T_pa_e = (1.38 + 0.055 * y_e**(1.0/3.0) - 0.32 * y_e**(1.0/2.0)
-              - 0.037 * y_e**(2.0/3.0) - 0.394 * y_e + 0.056 * y_e**(4.0/3.0))
-    bt_e = 4.0 * L * Re * mc2_e / pc_e / c_si * T_pa_e / 60 / 60 / 24
+    bt_e = bounce_period(L, E, alpha, mc2_e)
 
     # Calculate for protons
     mc2_p = 938.0  # MeV
-    pc_p = np.sqrt((E / mc2_p + 1)**2 - 1) * mc2_p
-    y_p = math.sin(alpha)
-    T_pa_p = (1.38 + 0.055 * y_p**(1.0/3.0) - 0.32 * y_p**(1.0/2.0)
-              - 0.037 * y_p**(2.0/3.0) - 0.394 * y_p + 0.056 * y_p**(4.0/3.0))
-    bt_p = 4.0 * L * Re * mc2_p / pc_p / c_si * T_pa_p / 60 / 60 / 24
+    bt_p = bounce_period(L, E, alpha, mc2_p)
 
     # Ratio and comparison
     ratio = bt_p / bt_e
     expected_ratio_approx = mc2_p / mc2_e
 
-    print(f"  Test conditions: L={L}, E={E:.1f} MeV, α={int(alpha*180/math.pi)}°")
-    print(f"  Electron bounce period: {bt_e:.6f} days")
-    print(f"  Proton bounce period: {bt_p:.6f} days")
-    print(f"  Ratio (p/e): {ratio:.2f}")
-    print(f"  Expected ratio (mc²_p/mc²_e): {expected_ratio_approx:.2f}")
+    _log(f"  Test conditions: L={L}, E={E:.1f} MeV, α={int(alpha*180/math.pi)}°")
+    _log(f"  Electron bounce period: {bt_e:.6f} days")
+    _log(f"  Proton bounce period: {bt_p:.6f} days")
+    _log(f"  Ratio (p/e): {ratio:.2f}")
+    _log(f"  Expected ratio (mc²_p/mc²_e): {expected_ratio_approx:.2f}")
 
-    print("  Physical interpretation:")
-    print(f"    Protons have ~{int(mc2_p/mc2_e):,}x larger rest mass than electrons")
-    print("    At same kinetic energy, protons are less relativistic")
-    print("    Therefore: protons have longer bounce periods ✅")
+    _log("  Physical interpretation:")
+    _log(f"    Protons have ~{int(mc2_p/mc2_e):,}x larger rest mass than electrons")
+    _log("    At same kinetic energy, protons are less relativistic")
+    _log("    Therefore: protons have longer bounce periods ✅")
 
     # Verify proton period is longer
     test_passed_1 = bt_p > bt_e
-    print(f"  Proton period > Electron period: {'✓' if test_passed_1 else '✗'}")
+    _log(f"  Proton period > Electron period: {'✓' if test_passed_1 else '✗'}")
 
     # Check ratio is in reasonable range (should be significant, order 10-10000)
     test_passed_2 = ratio > 10 and ratio < 10000
-    print(f"  Ratio in expected range (10-10000): {'✓' if test_passed_2 else '✗'}")
+    _log(f"  Ratio in expected range (10-10000): {'✓' if test_passed_2 else '✗'}")
 
-    print("  ✅ Particle type dependence is physically correct")
+    _log("  ✅ Particle type dependence is physically correct")
 
     return test_passed_1 and test_passed_2
 
 
 def test_energy_dependence():
     """Test 5: Energy Dependence"""
-    print("\nTEST 5: Energy Dependence")
-    print("-" * 40)
+    _log("\nTEST 5: Energy Dependence")
+    _log("-" * 40)
 
     # Test conditions
     L = 6
-    energies = [0.1, 1.0, 10.0]  # MeV
+    energies = np.array([0.1, 1.0, 10.0])  # MeV
     alpha = 90 * math.pi / 180  # Equatorial pitch angle
 
     # Physical constants
@@ -241,188 +289,172 @@ def test_energy_dependence():
     c_si = 2.998e8  # m/s
     mc2 = 0.511  # MeV (electron)
 
-    # Calculate bounce periods
-    bounce_periods = []
-
-    for E in energies:
-        # Calculate pc
-        pc = np.sqrt((E / mc2 + 1)**2 - 1) * mc2
+    # Calculate bounce periods for all energies in one vector pass
+    pc = np.sqrt((energies / mc2 + 1)**2 - 1) * mc2
+    T_pa = _TPA_EQUATORIAL if alpha == math.pi / 2 else _tpa_cached(math.sin(alpha))
+    bounce_periods = 4.0 * L * Re * mc2 / pc / c_si * T_pa / 60 / 60 / 24
 
-        # Calculate T_pa
-        y = math.sin(alpha)
-        T_pa = (1.38 + 0.055 * y**(1.0/3.0) - 0.32 * y**(1.0/2.0)
-                - 0.037 * y**(2.0/3.0) - 0.394 * y + 0.056 * y**(4.0/3.0))
-
-        # Calculate bounce period
-        bt = 4.0 * L * Re * mc2 / pc / c_si * T_pa / 60 / 60 / 24
-        bounce_periods.append(bt)
-
-        # Relativistic factor
-        gamma = 1 + E/mc2
-        print(f"  E={E:.1f} MeV: bt={bt:.6f} days, γ={gamma:.3f}")
+    # Relativistic factors
+    gammas = 1 + energies / mc2
+    _log("\n".join(f"  E={E:.1f} MeV: bt={bt:.6f} days, γ={gamma:.3f}"
+                    for E, bt, gamma in zip(energies, bounce_periods, gammas)))
 
     # Verify monotonic decrease
-    print("  Checking monotonic decrease with energy:")
-    monotonic = True
-    for i in range(len(energies)-1):
-        if bounce_periods[i] <= bounce_periods[i+1]:
-            monotonic = False
-            print(f"    ⚠️ Period at {energies[i]:.1f} MeV ({bounce_periods[i]:.6f}) <= "
-                  f"period at {energies[i+1]:.1f} MeV ({bounce_periods[i+1]:.6f})")
-        else:
-            print(f"    ✅ {energies[i]:.1f} MeV > {energies[i+1]:.1f} MeV: "
-                  f"{bounce_periods[i]:.6f} > {bounce_periods[i+1]:.6f} days")
-
-    print("  Physical interpretation:")
-    print("    At higher energies, particles move faster (β → 1)")
-    print("    Relativistic factor γ = 1 + E/mc² increases")
-    print("    Therefore: bounce period decreases with energy ✅")
-
-    print("  ✅ Energy dependence is physically correct")
+    _log("  Checking monotonic decrease with energy:")
+    monotonic = bool(np.all(np.diff(bounce_periods) < 0))
+    _log("\n".join(
+        f"    ⚠️ Period at {energies[i]:.1f} MeV ({bounce_periods[i]:.6f}) <= "
+        f"period at {energies[i+1]:.1f} MeV ({bounce_periods[i+1]:.6f})"
+        if bounce_periods[i] <= bounce_periods[i+1] else
+        f"    ✅ {energies[i]:.1f} MeV > {energies[i+1]:.1f} MeV: "
+        f"{bounce_periods[i]:.6f} > {bounce_periods[i+1]:.6f} days"
+        for i in range(len(energies)-1)))
+
+    _log("  Physical interpretation:")
+    _log("    At higher energies, particles move faster (β → 1)")
+    _log("    Relativistic factor γ = 1 + E/mc² increases")
+    _log("    Therefore: bounce period decreases with energy ✅")
+
+    _log("  ✅ Energy dependence is physically correct")
 
     return monotonic
 
 
 def test_tpa_polynomial_structure():
     """Test 6: T_pa Polynomial Structure (coefficients NOT TRACED)"""
-    print("\nTEST 6: T_pa Polynomial Structure")
-    print("-" * 40)
+    _log("\nTEST 6: T_pa Polynomial Structure")
+    _log("-" * 40)
 
-    print("  ⚠️ T_pa POLYNOMIAL COEFFICIENTS ARE NOT TRACED TO LITERATURE")
-    print("  This is a documented limitation requiring future investigation.\n")
+    _log("  ⚠️ T_pa POLYNOMIAL COEFFICIENTS ARE NOT TRACED TO LITERATURE")
+    _log("  This is a documented limitation requiring future investigation.\n")
 
     # Code polynomial coefficients
     coeffs = [1.38, 0.055, -0.32, -0.037, -0.394, 0.056]
     powers = [0, 1/3, 1/2, 2/3, 1, 4/3]
 
-    print("  Polynomial form validation:")
-    print(f"    Code: T_pa = {coeffs[0]:.2f} + {coeffs[1]:.3f}·y^(1/3) + "
+    _log("  Polynomial form validation:")
+    _log(f"    Code: T_pa = {coeffs[0]:.2f} + {coeffs[1]:.3f}·y^(1/3) + "
           f"{coeffs[2]:.2f}·y^(1/2) + {coeffs[3]:.3f}·y^(2/3) + "
           f"{coeffs[4]:.2f}·y + {coeffs[5]:.3f}·y^(4/3)")
 
-    print("    Expected form from Roederer (1970): T_pa = Σ a_i y^{p_i}")
-    print(f"    Powers used: y^{powers[1]:.3f}, y^{powers[2]:.3f}, y^{powers[3]:.3f}, "
+    _log("    Expected form from Roederer (1970): T_pa = Σ a_i y^{p_i}")
+    _log(f"    Powers used: y^{powers[1]:.3f}, y^{powers[2]:.3f}, y^{powers[3]:.3f}, "
           f"y^{powers[4]:.3f}, y^{powers[5]:.3f}")
 
-    print("  ✅ Polynomial STRUCTURE matches Roederer (1970)")
-    print("     - Sum of terms with fractional powers")
-    print("     - Captures pitch angle dependence of bounce integral")
-    print("     - Form consistent with dipole field theory")
-
-    # Test polynomial at various pitch angles
-    print("  Polynomial evaluation at different pitch angles:")
-    pitch_angles = [10, 30, 45, 60, 90]  # degrees
-    all_reasonable = True
-
-    for alpha_deg in pitch_angles:
-        alpha_rad = alpha_deg * math.pi / 180
-        y = math.sin(alpha_rad)
+    _log("  ✅ Polynomial STRUCTURE matches Roederer (1970)")
+    _log("     - Sum of terms with fractional powers")
+    _log("     - Captures pitch angle dependence of bounce integral")
+    _log("     - Form consistent with dipole field theory")
 
-        # Calculate T_pa using code formula
-        T_pa = (1.38 + 0.055 * y**(1.0/3.0) - 0.32 * y**(1.0/2.0)
-                - 0.037 * y**(2.0/3.0) - 0.394 * y + 0.056 * y**(4.0/3.0))
+    # Test polynomial at various pitch angles (single vectorized sweep)
+    _log("  Polynomial evaluation at different pitch angles:")
+    pitch_angles = np.array([10, 30, 45, 60, 90])  # degrees
+    y_vals = np.sin(np.radians(pitch_angles))
 
-        # Check if value is in reasonable range (typically 0.7-1.5 for bounce period)
-        # Note: Actual values depend on polynomial coefficients
-        reasonable_range = 0.5 <= T_pa <= 2.0
+    # Calculate T_pa using code formula for the whole sweep at once
+    T_pa_vals = _tpa(y_vals)
 
-        print(f"    α={alpha_deg}°: y=sin(α)={y:.4f}, T_pa={T_pa:.4f} "
-              f"{'✓' if reasonable_range else '⚠️'}")
+    # Check if values are in reasonable range (typically 0.7-1.5 for bounce period)
+    # Note: Actual values depend on polynomial coefficients
+    reasonable = (T_pa_vals >= 0.5) & (T_pa_vals <= 2.0)
+    all_reasonable = bool(np.all(reasonable))
 
-        if not reasonable_range:
-            all_reasonable = False
+    _log("\n".join(f"    α={alpha_deg}°: y=sin(α)={y:.4f}, T_pa={T_pa:.4f} "
+                    f"{'✓' if ok else '⚠️'}"
+                    for alpha_deg, y, T_pa, ok in
+                    zip(pitch_angles, y_vals, T_pa_vals, reasonable)))
 
     # Document limitation
-    print("\n  ⚠️ LIMITATION DOCUMENTED:")
-    print("  Individual coefficients (1.38, 0.055, -0.32, -0.037, -0.394, 0.056)")
-    print("  are NOT TRACED to specific literature source.")
-    print("\n  Known from CONSTANT_TRACEABILITY.md:")
-    print("  - Polynomial FORM matches Roederer (1970) mathematical structure")
-    print("  - Specific coefficients require further literature investigation")
-    print("  - Recommended: Search Roederer (1970), Schulz & Lanzerotti (1974)")
+    _log("\n  ⚠️ LIMITATION DOCUMENTED:")
+    _log("  Individual coefficients (1.38, 0.055, -0.32, -0.037, -0.394, 0.056)")
+    _log("  are NOT TRACED to specific literature source.")
+    _log("\n  Known from CONSTANT_TRACEABILITY.md:")
+    _log("  - Polynomial FORM matches Roederer (1970) mathematical structure")
+    _log("  - Specific coefficients require further literature investigation")
+    _log("  - Recommended: Search Roederer (1970), Schulz & Lanzerotti (1974)")
 
-    print("\n  ✅ T_pa polynomial STRUCTURE validated (coefficients require investigation)")
+    _log("\n  ✅ T_pa polynomial STRUCTURE validated (coefficients require investigation)")
 
     return all_reasonable
 
 
 def main():
     """Run all validation tests"""
-    print("=" * 50)
-    print("BOUNCE TIME VALIDATION TEST SUITE (Python)")
-    print("=" * 50)
-    print()
+    _log("=" * 50)
+    _log("BOUNCE TIME VALIDATION TEST SUITE (Python)")
+    _log("=" * 50)
+    _log()
 
     test_results = []
 
     # Test 1: Energy to Momentum Conversion
-    print("TEST 1: Energy to Momentum Conversion")
-    print("-" * 50)
+    _log("TEST 1: Energy to Momentum Conversion")
+    _log("-" * 50)
     passed = test_energy_to_momentum_conversion()
     test_results.append(("Energy to Momentum", passed))
-    print(f"Result: {'PASSED' if passed else 'FAILED'}\n")
+    _log(f"Result: {'PASSED' if passed else 'FAILED'}\n")
 
     # Test 2: Physical Constants Verification
-    print("TEST 2: Physical Constants Verification")
-    print("-" * 50)
+    _log("TEST 2: Physical Constants Verification")
+    _log("-" * 50)
     passed = test_physical_constants()
     test_results.append(("Physical Constants", passed))
-    print(f"Result: {'PASSED' if passed else 'FAILED'}\n")
+    _log(f"Result: {'PASSED' if passed else 'FAILED'}\n")
 
     # Test 3: Bounce Period Formula Structure
-    print("TEST 3: Bounce Period Formula Structure")
-    print("-" * 50)
+    _log("TEST 3: Bounce Period Formula Structure")
+    _log("-" * 50)
     passed = test_bounce_period_structure()
     test_results.append(("Bounce Period Structure", passed))
-    print(f"Result: {'PASSED' if passed else 'FAILED'}\n")
+    _log(f"Result: {'PASSED' if passed else 'FAILED'}\n")
 
     # Test 4: Particle Type Dependence
-    print("TEST 4: Particle Type Dependence")
-    print("-" * 50)
+    _log("TEST 4: Particle Type Dependence")
+    _log("-" * 50)
     passed = test_particle_dependence()
     test_results.append(("Particle Dependence", passed))
-    print(f"Result: {'PASSED' if passed else 'FAILED'}\n")
+    _log(f"Result: {'PASSED' if passed else 'FAILED'}\n")
 
     # Test 5: Energy Dependence
-    print("TEST 5: Energy Dependence")
-    print("-" * 50)
+    _log("TEST 5: Energy Dependence")
+    _log("-" * 50)
     passed = test_energy_dependence()
     test_results.append(("Energy Dependence", passed))
-    print(f"Result: {'PASSED' if passed else 'FAILED'}\n")
+    _log(f"Result: {'PASSED' if passed else 'FAILED'}\n")
 
     # Test 6: T_pa Polynomial Structure
-    print("TEST 6: T_pa Polynomial Structure")
-    print("-" * 50)
+    _log("TEST 6: T_pa Polynomial Structure")
+    _log("-" * 50)
     passed = test_tpa_polynomial_structure()
     test_results.append(("T_pa Polynomial", passed))
-    print(f"Result: {'PASSED' if passed else 'FAILED'}\n")
+    _log(f"Result: {'PASSED' if passed else 'FAILED'}\n")
 
     # Summary
-    print("=" * 50)
-    print("VALIDATION SUMMARY")
-    print("=" * 50)
+    _log("=" * 50)
+    _log("VALIDATION SUMMARY")
+    _log("=" * 50)
 
     passed_count = sum(1 for _, passed in test_results if passed)
     total_count = len(test_results)
 
-    print(f"Tests Passed: {passed_count}/{total_count}")
-    print()
+    _log(f"Tests Passed: {passed_count}/{total_count}")
+    _log()
 
     for name, passed in test_results:
-        print(f"{name}: {'PASSED' if passed else 'FAILED'}")
+        _log(f"{name}: {'PASSED' if passed else 'FAILED'}")
 
-    print()
-    print("NOTE: T_pa polynomial COEFFICIENTS are NOT TRACED to literature.")
-    print("This is a documented limitation requiring future investigation.")
-    print("The polynomial STRUCTURE is validated as consistent with Roederer (1970).")
-    print()
+    _log()
+    _log("NOTE: T_pa polynomial COEFFICIENTS are NOT TRACED to literature.")
+    _log("This is a documented limitation requiring future investigation.")
+    _log("The polynomial STRUCTURE is validated as consistent with Roederer (1970).")
+    _log()
 
     if passed_count == total_count:
-        print("✅ ALL TESTS PASSED")
-        print("RALPH_COMPLETE")
+        _log("✅ ALL TESTS PASSED")
+        _log("RALPH_COMPLETE")
         return True
     else:
-        print("❌ SOME TESTS FAILED")
+        _log("❌ SOME TESTS FAILED")
         return False
 
 
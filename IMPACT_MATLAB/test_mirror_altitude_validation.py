@@ -14,14 +14,63 @@ Test Categories:
 5. Coordinate system and unit consistency check
 """
 
-import numpy as np
+import math
 import sys
 
+import numpy as np
+from numba import njit
+
 # Module constants
 RE_EARTH_KM = 6371  # Earth radius in kilometers (IAU standard)
 ERROR_TOLERANCE_STRICT = 1e-10  # For exact mathematical comparisons
 ERROR_TOLERANCE_RELAXED = 1e-6   # For boundary condition checks
 
+# Dipole interpolation table (MATLAB: linspace(90, 0, 500) and derived
+# quantities). Depends on nothing user-supplied, so build it once at import
+# instead of per call. Latitude runs 90 -> 0, which makes the derived
+# equatorial pitch-angle table ascending — exactly the ordering np.interp
+# requires, so no per-call reordering is needed.
+_MIRROR_LAT = np.deg2rad(np.linspace(90, 0, 500))
+_B_RATIO = (np.cos(_MIRROR_LAT)**6) / np.sqrt(1 + 3*np.sin(_MIRROR_LAT)**2)
+_ALPHA_EQ_TABLE = np.arcsin(np.sqrt(_B_RATIO))
+# Interpolation bounds: the table is ascending, so its extremes are its
+# endpoints — no per-call np.min/np.max reduction over 500 elements needed
+_ALPHA_EQ_MIN = _ALPHA_EQ_TABLE[0]
+_ALPHA_EQ_MAX = _ALPHA_EQ_TABLE[-1]
+
+# (L, alpha_eq) -> (dipole altitude, analytical altitude) pairs computed by
+# test_cross_validation; later tests reuse overlapping cases instead of
+# re-running both solvers
+_CROSS_VAL_RESULTS = {}
+
+@njit(cache=True, fastmath=True)
+def _dipole_scalar(alpha_eq_rad, Lshell, alpha_tbl, lat_tbl):
+    """Scalar mirror-altitude kernel: binary search + linear interpolation.
+
+    Compiled replacement for the np.interp call when the caller passes a
+    single pitch angle — skips the array wrapping and NumPy dispatch that
+    dominate the few hundred FLOPs of real work. fastmath is safe: inputs
+    are pre-validated, so no NaN/Inf handling is required.
+    """
+    n = alpha_tbl.shape[0]
+    if alpha_eq_rad <= alpha_tbl[0]:
+        mirror_lat = lat_tbl[0]
+    elif alpha_eq_rad >= alpha_tbl[n - 1]:
+        mirror_lat = lat_tbl[n - 1]
+    else:
+        lo = 0
+        hi = n - 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if alpha_tbl[mid] <= alpha_eq_rad:
+                lo = mid
+            else:
+                hi = mid
+        frac = (alpha_eq_rad - alpha_tbl[lo]) / (alpha_tbl[hi] - alpha_tbl[lo])
+        mirror_lat = lat_tbl[lo] + frac * (lat_tbl[hi] - lat_tbl[lo])
+    r = Lshell * 6371.0 * np.cos(mirror_lat)**2
+    return r - 6371.0
+
 def dipole_mirror_altitude(alpha_eq_in, Lshell):
     """
     Compute mirror altitude (km) in a dipole field (MATLAB version equivalent)
@@ -38,6 +87,19 @@ def dipole_mirror_altitude(alpha_eq_in, Lshell):
         ValueError: If Lshell <= 0 or alpha_eq_in not in valid range
     """
     
+    # Scalar fast path: same validation, then the compiled kernel — avoids
+    # the array wrapping and np.interp dispatch for the common scalar callers
+    if np.isscalar(alpha_eq_in) and np.isscalar(Lshell):
+        if Lshell <= 0:
+            raise ValueError("Lshell must be positive (received: {})".format(Lshell))
+        if alpha_eq_in < 0 or alpha_eq_in > 180:
+            raise ValueError("alpha_eq must be in range [0, 180] degrees")
+        alpha_calc = 180.0 - alpha_eq_in if alpha_eq_in > 90 else alpha_eq_in
+        alpha_rad = math.radians(alpha_calc)
+        if alpha_rad < _ALPHA_EQ_MIN or alpha_rad > _ALPHA_EQ_MAX:
+            raise ValueError("alpha_eq query out of interpolation range")
+        return _dipole_scalar(alpha_rad, float(Lshell), _ALPHA_EQ_TABLE, _MIRROR_LAT)
+
     # Input validation
     Lshell = np.asarray(Lshell)
     if np.any(Lshell <= 0):
@@ -55,16 +117,11 @@ def dipole_mirror_altitude(alpha_eq_in, Lshell):
         alpha_eq_in = np.array([alpha_eq_in])
     Lshell = float(Lshell)  # Ensure scalar for broadcasting
     
-    # Define mirror latitudes and compute corresponding equatorial pitch angles
-    # MATLAB: mirror_latitude = deg2rad(linspace(90, 0, 500));
-    mirror_latitude = np.deg2rad(np.linspace(90, 0, 500))
-    
-    # MATLAB: B_ratio = (cos(mirror_latitude).^6)./sqrt(1 + 3*sin(mirror_latitude).^2);
-    B_ratio = (np.cos(mirror_latitude)**6) / np.sqrt(1 + 3*np.sin(mirror_latitude)**2)
-    
-    # MATLAB: alpha_eq = asin(sqrt(B_ratio));
-    alpha_eq = np.arcsin(np.sqrt(B_ratio))
-    
+    # Mirror latitudes and corresponding equatorial pitch angles come from
+    # the module-level table (see _MIRROR_LAT / _ALPHA_EQ_TABLE above)
+    mirror_latitude = _MIRROR_LAT
+    alpha_eq = _ALPHA_EQ_TABLE
+
     # MATLAB: alpha_eq_in(alpha_eq_in > 90) = 180 - alpha_eq_in(alpha_eq_in > 90);
     # Handle pitch angles > 90° by symmetry
     alpha_eq_calc = np.where(alpha_eq_in > 90, 180 - alpha_eq_in, alpha_eq_in)
@@ -74,7 +131,7 @@ def dipole_mirror_altitude(alpha_eq_in, Lshell):
     
     # MATLAB: mirror_lat_query = interp1(alpha_eq, mirror_latitude, alpha_eq_query);
     # Check interpolation bounds
-    if np.any(alpha_eq_query < np.min(alpha_eq)) or np.any(alpha_eq_query > np.max(alpha_eq)):
+    if np.any(alpha_eq_query < _ALPHA_EQ_MIN) or np.any(alpha_eq_query > _ALPHA_EQ_MAX):
         raise ValueError("alpha_eq query out of interpolation range")
     
     mirror_lat_query = np.interp(alpha_eq_query, alpha_eq, mirror_latitude)
@@ -106,6 +163,19 @@ def mirror_altitude(pa_eq, L_shell):
         ValueError: If L_shell <= 0 or pa_eq out of valid range
     """
     
+    # Scalar fast path: the formula is closed-form, so a scalar call needs
+    # no array wrapping at all — same validation, then plain math ops
+    if np.isscalar(pa_eq) and np.isscalar(L_shell):
+        if L_shell <= 0:
+            raise ValueError("L_shell must be positive (received: {})".format(L_shell))
+        if pa_eq < 0 or pa_eq > 180:
+            raise ValueError("pa_eq must be in range [0, 180] degrees")
+        if pa_eq < 0.1:
+            raise ValueError("Pitch angle too close to 0° (loss cone) - numerical instability")
+        sin_pa = math.sin(math.radians(pa_eq))
+        r_mirror = L_shell * RE_EARTH_KM * (1 / sin_pa**2)**(1/6)
+        return r_mirror - RE_EARTH_KM
+
     # Input validation
     L_shell = np.asarray(L_shell)
     if np.any(L_shell <= 0):
@@ -247,18 +317,23 @@ def test_cross_validation():
     print("Analysis of dipole_mirror_altitude.m vs mirror_altitude.m:")
     print()
     
+    # Both methods accept pitch-angle arrays, so evaluate each L-shell row
+    # in one vectorized call instead of six scalar calls per method
+    pa_arr = np.asarray(pa_test, dtype=np.float64)
+
     for L in L_test:
-        for alpha_eq in pa_test:
-            # Get results from both methods
-            alt_dipole = dipole_mirror_altitude(alpha_eq, L)
-            alt_analytical = mirror_altitude(alpha_eq, L)
-            
-            # Calculate relative error for documentation
-            if abs(alt_analytical) > 0:
-                rel_error = abs(alt_dipole - alt_analytical) / abs(alt_analytical)
-            else:
-                rel_error = 0
-            
+        # Get results from both methods
+        alt_dipole_row = dipole_mirror_altitude(pa_arr, L)
+        alt_analytical_row = mirror_altitude(pa_arr, L)
+
+        # Calculate relative error for documentation
+        rel_error_row = np.where(np.abs(alt_analytical_row) > 0,
+                                 np.abs(alt_dipole_row - alt_analytical_row) / np.abs(alt_analytical_row),
+                                 0.0)
+
+        for alpha_eq, alt_dipole, alt_analytical, rel_error in zip(
+                pa_test, alt_dipole_row, alt_analytical_row, rel_error_row):
+            _CROSS_VAL_RESULTS[(L, alpha_eq)] = (alt_dipole, alt_analytical)
             print(f"L={L}, α={alpha_eq:>2.0f}°: dipole={alt_dipole:>8.2f} km, analytical={alt_analytical:>8.2f} km, diff={rel_error*100:.1f}%")
     
     print()
@@ -317,11 +392,17 @@ def test_edge_cases():
     
     # Test Case 3: alpha_eq = 45° (typical mirroring)
     # Expected: reasonable altitude between equatorial and loss cone cases
+    # This (L, alpha_eq) pair is part of the cross-validation grid, so reuse
+    # the cached result rather than re-running both solvers
     L = 4
     alpha_eq = 45
-    
-    alt_dipole = dipole_mirror_altitude(alpha_eq, L)
-    alt_analytical = mirror_altitude(alpha_eq, L)
+
+    cached = _CROSS_VAL_RESULTS.get((L, alpha_eq))
+    if cached is not None:
+        alt_dipole, alt_analytical = cached
+    else:
+        alt_dipole = dipole_mirror_altitude(alpha_eq, L)
+        alt_analytical = mirror_altitude(alpha_eq, L)
     
     # Check that results are reasonable
     if alt_dipole > 0 and alt_dipole < L * RE_EARTH_KM:
@@ -5,115 +5,156 @@ Runs validation tests without MATLAB using Python and shell commands
 """
 
 import subprocess
+import functools
+import io
+import mmap
 import os
+import shlex
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a shell command and return result"""
+@functools.lru_cache(maxsize=4)
+def _load_msis_output(path_str, mtime):
+    """Parse an MSIS text file once and reuse it across tiers.
+
+    Returns (header line, data array). Keyed on (path, mtime) so a file
+    rewritten between calls is re-read, while repeated validation passes
+    over the same file share a single parsed buffer.
+    """
+    # Map the file instead of reading it into userspace buffers: the header
+    # and the loadtxt parse both walk the same kernel page-cache pages, and
+    # repeated loads of a large file avoid a full copy per read
+    with open(path_str, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header = mm.readline().decode().strip()
+            # Feed the remaining lines lazily out of the mapping (iterating
+            # the mmap object itself would yield single bytes)
+            data = np.loadtxt(iter(mm.readline, b''), ndmin=2)
+    return header, data
+
+@functools.lru_cache(maxsize=None)
+def _stat(path_str):
+    """One cached os.stat per path per run; None if the path is missing.
+
+    The tiers probe the same few paths repeatedly (exists, mtime,
+    executability) — each probe is a metadata round-trip on networked
+    filesystems, so collapse them to a single syscall per path.
+    """
+    try:
+        return os.stat(path_str)
+    except OSError:
+        return None
+
+# Expected msisinputs.txt header fields; checked by hashed set containment
+# rather than one substring scan of the header per field
+_EXPECTED_INPUT_FIELDS = frozenset(
+    ['iyd', 'sec', 'alt', 'glat', 'glong', 'stl', 'f107a', 'f107', 'Ap'])
+
+def run_command(cmd, description, *, shell=False):
+    """Run a command and return (success, stdout, stderr).
+
+    Accepts an argv list (preferred: the command is exec'd directly with no
+    intermediate /bin/sh fork) or a string, which is shlex-split unless
+    shell=True is passed explicitly for commands that need shell features.
+    """
     print(f"Running: {description}")
+    if isinstance(cmd, str) and not shell:
+        cmd = shlex.split(cmd)
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
-        return result.returncode == 0, result.stdout, result.stderr
+        # 64K pipe buffers instead of capture_output's default: fewer reads
+        # when the executable emits real logs
+        proc = subprocess.Popen(cmd, shell=shell, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, bufsize=65536, text=True)
+        stdout, stderr = proc.communicate(timeout=30)
+        return proc.returncode == 0, stdout, stderr
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
         return False, "", "Command timed out"
 
-def tier1_static_validation():
+def tier1_static_validation(stream=sys.stdout):
     """Tier 1: Static validation of physical constants"""
-    print("\n" + "="*50)
-    print("TIER 1: Static Validation")
-    print("="*50)
+    out = functools.partial(print, file=stream)
+    out("\n" + "="*50)
+    out("TIER 1: Static Validation")
+    out("="*50)
     
     passed = 0
     failed = 0
     
     # 1.1 Atomic masses
-    print("\nTesting atomic masses...")
-    ref_masses = {
-        'He': 4.0026,
-        'O': 15.999,
-        'N2': 28.0134,
-        'O2': 31.9988,
-        'Ar': 39.948,
-        'H': 1.00784,
-        'NO': 30.006
-    }
-    
-    impl_masses = {
-        'He': 4.0,
-        'O': 16.0,
-        'N2': 28.02,
-        'O2': 32.0,
-        'Ar': 39.95,
-        'H': 1.0,
-        'NO': 30.0
-    }
-    
-    tolerance = 0.001  # 0.1% tolerance
-    h_tolerance = 0.01  # 1% tolerance for H (known exception)
-    all_pass = True
-    
-    for species, ref_val in ref_masses.items():
-        impl_val = impl_masses[species]
-        rel_error = abs(impl_val - ref_val) / ref_val
-        tol = h_tolerance if species == 'H' else tolerance
-        if rel_error < tol:
-            print(f"  ✓ {species}: {impl_val:.2f} (error: {rel_error*100:.3f}%)")
+    out("\nTesting atomic masses...")
+    # Aligned arrays (structure-of-arrays): one vectorized error/tolerance
+    # comparison instead of per-species dict lookups and scalar divides
+    species = ('He', 'O', 'N2', 'O2', 'Ar', 'H', 'NO')
+    ref_masses = np.array([4.0026, 15.999, 28.0134, 31.9988, 39.948, 1.00784, 30.006])
+    impl_masses = np.array([4.0, 16.0, 28.02, 32.0, 39.95, 1.0, 30.0])
+
+    tolerances = np.full(len(species), 0.001)    # 0.1% tolerance
+    tolerances[species.index('H')] = 0.01        # 1% tolerance for H (known exception)
+
+    rel_errors = np.abs(impl_masses - ref_masses) / ref_masses
+    fails = rel_errors >= tolerances
+    all_pass = not fails.any()
+
+    for name, impl_val, rel_error, tol, fail in zip(species, impl_masses,
+                                                    rel_errors, tolerances, fails):
+        if not fail:
+            out(f"  ✓ {name}: {impl_val:.2f} (error: {rel_error*100:.3f}%)")
         else:
-            print(f"  ✗ {species}: {impl_val:.2f} (error: {rel_error*100:.3f}%, exceeds {tol*100}%)")
-            all_pass = False
-    
+            out(f"  ✗ {name}: {impl_val:.2f} (error: {rel_error*100:.3f}%, exceeds {tol*100}%)")
+
     if all_pass:
-        print("  ✓ All atomic masses within tolerance")
+        out("  ✓ All atomic masses within tolerance")
         passed += 1
     else:
         failed += 1
     
-    # 1.2 AMU conversion
-    print("\nTesting AMU conversion...")
-    ref_amu = 1.66053906660e-27
-    impl_amu = 1.66e-27
-    rel_error = abs(impl_amu - ref_amu) / ref_amu
-    tolerance = 0.001
-    
-    if rel_error < tolerance:
-        print(f"  ✓ AMU: {impl_amu:.3e} kg (error: {rel_error*100:.3f}%)")
+    # 1.2 AMU conversion / 1.3 Boltzmann constant
+    # Both sections run the same abs(impl-ref)/ref < tol pattern, so the
+    # (impl, ref, tol) triples live in one table checked with a single
+    # vectorized comparison; the sections below only format the results.
+    # g0/Re (1.4) use absolute tolerances and stay separate.
+    const_impl = np.array([1.66e-27, 1.38e-23])          # AMU (kg), k (J/K)
+    const_ref = np.array([1.66053906660e-27, 1.380649e-23])
+    const_tol = np.array([0.001, 0.001])
+    const_rel = np.abs(const_impl - const_ref) / const_ref
+    const_ok = const_rel < const_tol
+
+    out("\nTesting AMU conversion...")
+    if const_ok[0]:
+        out(f"  ✓ AMU: {const_impl[0]:.3e} kg (error: {const_rel[0]*100:.3f}%)")
         passed += 1
     else:
-        print(f"  ✗ AMU: {impl_amu:.3e} kg (error: {rel_error*100:.3f}%)")
+        out(f"  ✗ AMU: {const_impl[0]:.3e} kg (error: {const_rel[0]*100:.3f}%)")
         failed += 1
-    
-    # 1.3 Boltzmann constant
-    print("\nTesting Boltzmann constant...")
-    ref_k = 1.380649e-23
-    impl_k = 1.38e-23
-    rel_error = abs(impl_k - ref_k) / ref_k
-    tolerance = 0.001
-    
-    if rel_error < tolerance:
-        print(f"  ✓ k: {impl_k:.3e} J/K (error: {rel_error*100:.3f}%)")
+
+    out("\nTesting Boltzmann constant...")
+    if const_ok[1]:
+        out(f"  ✓ k: {const_impl[1]:.3e} J/K (error: {const_rel[1]*100:.3f}%)")
         passed += 1
     else:
-        print(f"  ✗ k: {impl_k:.3e} J/K (error: {rel_error*100:.3f}%)")
+        out(f"  ✗ k: {const_impl[1]:.3e} J/K (error: {const_rel[1]*100:.3f}%)")
         failed += 1
     
     # 1.4 Gravitational parameters
-    print("\nTesting gravitational parameters...")
+    out("\nTesting gravitational parameters...")
     ref_g0 = 9.80665
     impl_g0 = 9.80665
     ref_Re = 6371
     impl_Re = 6371
     
     if abs(impl_g0 - ref_g0) < 1e-5 and abs(impl_Re - ref_Re) < 1:
-        print(f"  ✓ g0 = {impl_g0:.5f} m/s², Re = {impl_Re} km")
+        out(f"  ✓ g0 = {impl_g0:.5f} m/s², Re = {impl_Re} km")
         passed += 1
     else:
-        print(f"  ✗ g0 = {impl_g0}, Re = {impl_Re}")
+        out(f"  ✗ g0 = {impl_g0}, Re = {impl_Re}")
         failed += 1
     
     # 1.5 Scale height formula
-    print("\nTesting scale height formula...")
+    out("\nTesting scale height formula...")
     k = 1.38e-23  # Boltzmann constant (J/K)
     T = 500  # Temperature (K)
     
@@ -125,88 +166,84 @@ def tier1_static_validation():
     H = k * T / (M_per_molecule * g)  # Scale height in meters
     
     if 0.01 < H < 1e6 and H > 1000:  # in meters, should be ~50-80 km
-        print(f"  ✓ H = {H:.1f} m = {H/1000:.1f} km (physically reasonable)")
+        out(f"  ✓ H = {H:.1f} m = {H/1000:.1f} km (physically reasonable)")
         passed += 1
     else:
-        print(f"  ✗ H = {H:.1f} m (unreasonable)")
+        out(f"  ✗ H = {H:.1f} m (unreasonable)")
         failed += 1
     
     # 1.6 Gravitational correction
-    print("\nTesting gravitational altitude correction...")
+    out("\nTesting gravitational altitude correction...")
     g0 = 9.80665
     Re = 6371
-    test_alts = [0, 100, 300, 500, 1000]
-    g_alts = [g0 * (Re / (Re + alt))**2 for alt in test_alts]
-    
-    if all(g_alts[i] < g_alts[i-1] for i in range(1, len(g_alts))) and all(g > 0 for g in g_alts):
-        print(f"  ✓ Gravity decreases correctly with altitude")
+    test_alts = np.array([0, 100, 300, 500, 1000], dtype=np.float64)
+    g_alts = g0 * (Re / (Re + test_alts))**2
+
+    if np.all(np.diff(g_alts) < 0) and np.all(g_alts > 0):
+        out(f"  ✓ Gravity decreases correctly with altitude")
         passed += 1
     else:
-        print(f"  ✗ Gravity correction failed")
+        out(f"  ✗ Gravity correction failed")
         failed += 1
     
     return passed, failed
 
-def tier2_file_validation():
+def tier2_file_validation(stream=sys.stdout):
     """Tier 2: File format validation"""
-    print("\n" + "="*50)
-    print("TIER 2: File Format Validation")
-    print("="*50)
+    out = functools.partial(print, file=stream)
+    out("\n" + "="*50)
+    out("TIER 2: File Format Validation")
+    out("="*50)
     
     passed = 0
     failed = 0
     msis_dir = Path("/work/projects/IMPACT/nrlmsis2.1")
     
     # 2.1 Input file structure
-    print("\nTesting input file structure...")
+    out("\nTesting input file structure...")
     input_file = msis_dir / "msisinputs.txt"
     
-    if input_file.exists():
-        with open(input_file, 'r') as f:
-            lines = f.readlines()
-        
-        header = lines[0].strip()
-        expected_fields = ['iyd', 'sec', 'alt', 'glat', 'glong', 'stl', 'f107a', 'f107', 'Ap']
-        
-        if all(field in header for field in expected_fields):
+    input_st = _stat(str(input_file))
+    if input_st is not None:
+        header, data = _load_msis_output(str(input_file), input_st.st_mtime)
+
+        if _EXPECTED_INPUT_FIELDS <= frozenset(header.split()):
             # Check first data line has 9 columns
-            data_cols = len(lines[1].split())
+            data_cols = data.shape[1]
             if data_cols == 9:
-                print(f"  ✓ Input file structure correct (9 columns)")
+                out(f"  ✓ Input file structure correct (9 columns)")
                 passed += 1
             else:
-                print(f"  ✗ Input file has {data_cols} columns, expected 9")
+                out(f"  ✗ Input file has {data_cols} columns, expected 9")
                 failed += 1
         else:
-            print(f"  ✗ Input file header missing fields")
+            out(f"  ✗ Input file header missing fields")
             failed += 1
     else:
-        print(f"  ✗ Input file not found")
+        out(f"  ✗ Input file not found")
         failed += 1
     
     # 2.2 Output file structure
-    print("\nTesting output file structure...")
+    out("\nTesting output file structure...")
     output_file = msis_dir / "msisoutputs.txt"
     
-    if output_file.exists():
-        with open(output_file, 'r') as f:
-            lines = f.readlines()
-        
-        header = lines[0].strip()
-        data_cols = len(lines[1].split())
-        
+    output_st = _stat(str(output_file))
+    if output_st is not None:
+        header, data = _load_msis_output(str(output_file), output_st.st_mtime)
+        data_cols = data.shape[1]
+
         if data_cols == 20:
-            print(f"  ✓ Output file structure correct (20 columns)")
+            out(f"  ✓ Output file structure correct (20 columns)")
             passed += 1
         else:
-            print(f"  ✗ Output file has {data_cols} columns, expected 20")
+            out(f"  ✗ Output file has {data_cols} columns, expected 20")
             failed += 1
     else:
-        print(f"  ✗ Output file not found")
+        out(f"  ✗ Output file not found")
         failed += 1
     
     # 2.3 Column mapping
-    print("\nTesting column mapping...")
+    out("\nTesting column mapping...")
     expected_mapping = {
         'iyd': 1, 'sec': 2, 'alt': 3, 'glat': 4, 'glong': 5,
         'stl': 6, 'f107a': 7, 'f107': 8, 'Ap': 9,
@@ -215,19 +252,20 @@ def tier2_file_validation():
     }
     
     if all(1 <= idx <= 20 for idx in expected_mapping.values()):
-        print("  ✓ Column mapping correct (all indices 1-20)")
+        out("  ✓ Column mapping correct (all indices 1-20)")
         passed += 1
     else:
-        print("  ✗ Column mapping invalid")
+        out("  ✗ Column mapping invalid")
         failed += 1
     
     return passed, failed
 
-def tier3_numerical_validation():
+def tier3_numerical_validation(stream=sys.stdout):
     """Tier 3: Numerical validation using existing MSIS outputs"""
-    print("\n" + "="*50)
-    print("TIER 3: Numerical Validation")
-    print("="*50)
+    out = functools.partial(print, file=stream)
+    out("\n" + "="*50)
+    out("TIER 3: Numerical Validation")
+    out("="*50)
     
     passed = 0
     failed = 0
@@ -235,118 +273,103 @@ def tier3_numerical_validation():
     output_file = msis_dir / "msisoutputs.txt"
     
     # 3.1 Fortran executable availability
-    print("\nTesting Fortran executable...")
+    out("\nTesting Fortran executable...")
     exe_file = msis_dir / "msis2.1_test.exe"
     
-    if exe_file.exists() and os.access(exe_file, os.X_OK):
-        print("  ✓ MSIS executable found and valid")
+    exe_st = _stat(str(exe_file))
+    if exe_st is not None and exe_st.st_mode & 0o111:
+        out("  ✓ MSIS executable found and valid")
         passed += 1
     else:
-        print("  ✗ MSIS executable not found or not executable")
+        out("  ✗ MSIS executable not found or not executable")
         failed += 1
     
     # 3.2 Parse and validate MSIS outputs
-    print("\nValidating MSIS numerical outputs...")
-    
-    if output_file.exists():
-        with open(output_file, 'r') as f:
-            lines = f.readlines()
-        
-        # Skip header, parse first few data lines
-        data_lines = lines[1:6]  # First 5 data lines
-        
-        densities = []
-        temperatures = []
-        
-        for line in data_lines:
-            cols = line.split()
-            if len(cols) >= 20:
-                try:
-                    rho = float(cols[14])  # Column 15 (index 14)
-                    T = float(cols[19])    # Column 20 (index 19)
-                    densities.append(rho)
-                    temperatures.append(T)
-                except (ValueError, IndexError) as e:
-                    print(f"  ✗ Failed to parse line: {e}")
-                    failed += 1
-                    break
-        
-        if densities:
+    out("\nValidating MSIS numerical outputs...")
+    
+    output_st = _stat(str(output_file))
+    if output_st is not None:
+        # Density (column 15) and temperature (column 20) slices of the
+        # cached parse — shared with tier 2 — covering both this section
+        # (first 5 rows) and the altitude-trend check below (first 10 rows)
+        try:
+            _, full = _load_msis_output(str(output_file), output_st.st_mtime)
+            data = full[:10, [14, 19]]
+        except (ValueError, IndexError) as e:
+            out(f"  ✗ Failed to parse line: {e}")
+            failed += 1
+            data = np.empty((0, 2))
+
+        densities = data[:5, 0]   # First 5 data lines
+        temperatures = data[:5, 1]
+
+        if densities.size:
             # Check positive values
-            if all(d > 0 for d in densities):
-                print(f"  ✓ All densities positive: {densities[0]:.2e} to {densities[-1]:.2e} g/cm³")
+            if (densities > 0).all():
+                out(f"  ✓ All densities positive: {densities[0]:.2e} to {densities[-1]:.2e} g/cm³")
                 passed += 1
             else:
-                print(f"  ✗ Some densities negative or zero")
+                out(f"  ✗ Some densities negative or zero")
                 failed += 1
-            
+
             # Check magnitude (0-10 km: 10^-6 to 10^-3 g/cm³)
             # Task documentation says "10^-12 to 10^-6 g/cm³" but that's for higher altitudes
             # At 0-10 km, densities should be around 10^-3 to 10^-6 g/cm³
-            if all(1e-6 < d < 1e-2 for d in densities):
-                print(f"  ✓ Density magnitude in expected range: {min(densities):.2e} to {max(densities):.2e} g/cm³")
+            if ((densities > 1e-6) & (densities < 1e-2)).all():
+                out(f"  ✓ Density magnitude in expected range: {densities.min():.2e} to {densities.max():.2e} g/cm³")
                 passed += 1
             else:
-                print(f"  ✗ Density magnitude out of range: {min(densities):.2e} to {max(densities):.2e} g/cm³")
+                out(f"  ✗ Density magnitude out of range: {densities.min():.2e} to {densities.max():.2e} g/cm³")
                 failed += 1
-            
+
             # Check temperature reasonableness
-            if all(100 < T < 2000 for T in temperatures):
-                print(f"  ✓ Temperature reasonable: {temperatures[0]:.1f} to {temperatures[-1]:.1f} K")
+            if ((temperatures > 100) & (temperatures < 2000)).all():
+                out(f"  ✓ Temperature reasonable: {temperatures[0]:.1f} to {temperatures[-1]:.1f} K")
                 passed += 1
             else:
-                print(f"  ✗ Temperature out of range")
+                out(f"  ✗ Temperature out of range")
                 failed += 1
     else:
-        print("  ✗ Cannot validate outputs - file not found")
+        out("  ✗ Cannot validate outputs - file not found")
         failed += 3  # 3 tests failed
-    
+
     # 3.3 Altitude trend
-    print("\nValidating altitude trend...")
-    
-    if output_file.exists():
-        with open(output_file, 'r') as f:
-            lines = f.readlines()
-        
-        # Get densities at different altitudes
-        densities = []
-        for line in lines[1:11]:  # First 10 lines (0-9 km)
-            cols = line.split()
-            if len(cols) >= 15:
-                try:
-                    rho = float(cols[14])
-                    densities.append(rho)
-                except (ValueError, IndexError):
-                    pass
-        
-        if len(densities) >= 2:
+    out("\nValidating altitude trend...")
+
+    if output_st is not None:
+        # Densities at different altitudes: first 10 lines (0-9 km), already
+        # parsed above
+        densities = data[:, 0]
+
+        if densities.size >= 2:
             # Check density decreases
-            if all(densities[i] > densities[i+1] for i in range(len(densities)-1)):
-                print("  ✓ Density decreases with altitude")
+            if np.all(np.diff(densities) < 0):
+                out("  ✓ Density decreases with altitude")
                 passed += 1
             else:
-                print("  ✗ Density does not decrease monotonically")
+                out("  ✗ Density does not decrease monotonically")
                 failed += 1
         else:
-            print("  ✗ Insufficient data for altitude trend analysis")
+            out("  ✗ Insufficient data for altitude trend analysis")
             failed += 1
     else:
-        print("  ✗ Cannot validate trend - file not found")
+        out("  ✗ Cannot validate trend - file not found")
         failed += 1
     
     return passed, failed
 
-def tier4_spatial_validation():
+def tier4_spatial_validation(stream=sys.stdout):
     """Tier 4: Spatial averaging validation"""
-    print("\n" + "="*50)
-    print("TIER 4: Spatial Averaging Validation")
-    print("="*50)
+    out = functools.partial(print, file=stream)
+    out("\n" + "="*50)
+    out("TIER 4: Spatial Averaging Validation")
+    out("="*50)
     
     passed = 0
     failed = 0
     
     # 4.1 Reshape logic
-    print("\nTesting reshape logic...")
+    out("\nTesting reshape logic...")
     
     nalt, nglong, nglat, ndate = 10, 4, 3, 4
     nblocks = nalt * nglong * nglat * ndate
@@ -356,14 +379,14 @@ def tier4_spatial_validation():
     test_reshape = test_data.reshape(nalt, nglong, nglat, ndate)
     
     if test_reshape.shape == (nalt, nglong, nglat, ndate):
-        print("  ✓ Reshape logic correct")
+        out("  ✓ Reshape logic correct")
         passed += 1
     else:
-        print("  ✗ Reshape logic failed")
+        out("  ✗ Reshape logic failed")
         failed += 1
     
     # 4.2 Mean calculation
-    print("\nTesting mean calculation...")
+    out("\nTesting mean calculation...")
     
     # Test data: reshape 1:nblocks into [nalt, nglong, nglat, ndate]
     nalt, nglong, nglat, ndate = 10, 4, 3, 4
@@ -377,8 +400,10 @@ def tier4_spatial_validation():
     # We need to be careful about the order
     # Let's just verify the mathematical operation is correct
     
-    # Create a simple test case where we know the answer
-    simple_data = np.ones((nalt, nglong, nglat, ndate))
+    # Create a simple test case where we know the answer; broadcast_to gives
+    # a zero-stride all-ones view, so the reduction runs without ever
+    # materializing the 480-element array
+    simple_data = np.broadcast_to(np.float64(1.0), (nalt, nglong, nglat, ndate))
     simple_mean = np.mean(simple_data, axis=(1, 2, 3))
     
     if np.allclose(simple_mean, np.ones(nalt)):
@@ -386,21 +411,22 @@ def tier4_spatial_validation():
         test_reshape = test_data.reshape(nalt, nglong, nglat, ndate)
         averaged = np.mean(test_reshape, axis=(1, 2, 3))
         
-        # Verify by manual calculation for first altitude level
-        manual_mean = np.mean(test_data[0:nglong*nglat*ndate])
+        # Verify against the closed form for the first altitude level: the
+        # mean of 1..nglong*nglat*ndate is (n + 1)/2
+        manual_mean = (nglong*nglat*ndate + 1) / 2.0
         
         if abs(averaged[0] - manual_mean) < 1e-10:
-            print("  ✓ Mean calculation correct")
+            out("  ✓ Mean calculation correct")
             passed += 1
         else:
-            print(f"  ✗ Mean calculation failed: {averaged[0]} vs {manual_mean}")
+            out(f"  ✗ Mean calculation failed: {averaged[0]} vs {manual_mean}")
             failed += 1
     else:
-        print("  ✗ Mean calculation basic test failed")
+        out("  ✗ Mean calculation basic test failed")
         failed += 1
     
     # 4.3 Output dimensions
-    print("\nTesting output dimensions...")
+    out("\nTesting output dimensions...")
     
     # Simulate get_msis_dat output
     nalt_test = 5
@@ -408,10 +434,10 @@ def tier4_spatial_validation():
     H_out = np.random.rand(nalt_test, 1)
     
     if rho_out.shape == (nalt_test, 1) and H_out.shape == (nalt_test, 1):
-        print(f"  ✓ Output dimensions correct: [{nalt_test}, 1]")
+        out(f"  ✓ Output dimensions correct: [{nalt_test}, 1]")
         passed += 1
     else:
-        print(f"  ✗ Output dimensions incorrect")
+        out(f"  ✗ Output dimensions incorrect")
         failed += 1
     
     return passed, failed
@@ -425,11 +451,19 @@ def main():
     print(f"Date: January 16, 2026")
     print(f"Working directory: {os.getcwd()}")
     
-    # Run all tiers
-    t1_pass, t1_fail = tier1_static_validation()
-    t2_pass, t2_fail = tier2_file_validation()
-    t3_pass, t3_fail = tier3_numerical_validation()
-    t4_pass, t4_fail = tier4_spatial_validation()
+    # Run all tiers concurrently — they are independent, and tiers 2/3 are
+    # I/O-bound, so wall time is bounded by the slowest tier rather than the
+    # sum. Each tier prints into its own buffer; flushing in submission
+    # order keeps the output identical to a serial run.
+    tiers = (tier1_static_validation, tier2_file_validation,
+             tier3_numerical_validation, tier4_spatial_validation)
+    buffers = [io.StringIO() for _ in tiers]
+    with ThreadPoolExecutor(max_workers=len(tiers)) as executor:
+        futures = [executor.submit(fn, buf) for fn, buf in zip(tiers, buffers)]
+        (t1_pass, t1_fail), (t2_pass, t2_fail), (t3_pass, t3_fail), (t4_pass, t4_fail) = \
+            [f.result() for f in futures]
+    for buf in buffers:
+        sys.stdout.write(buf.getvalue())
     
     # Summary
     total_pass = t1_pass + t2_pass + t3_pass + t4_pass